@@ -13,25 +13,17 @@ def best_strategy(theta, obj_train, encoding, problem):
     # Serial solution over the strategies
     results = [problem.solve(strategy=strategy) for strategy in encoding]
 
-    # Compute cost degradation
-    degradation = []
-    for r in results:
+    # Compute cost degradation for all strategies at once
+    cost = np.array([r['cost'] for r in results])
+    infeas = np.array([r['infeasibility'] for r in results])
+    cost[infeas > stg.INFEAS_TOL] = np.inf
 
-        cost = r['cost']
-
-        if r['infeasibility'] > stg.INFEAS_TOL:
-            cost = np.inf
-
-        diff = np.abs(cost - obj_train)
-        if np.abs(obj_train) > stg.DIVISION_TOL:  # Normalize in case
-            diff /= np.abs(obj_train)
-        degradation.append(diff)
+    degradation = np.abs(cost - obj_train)
+    if np.abs(obj_train) > stg.DIVISION_TOL:  # Normalize in case
+        degradation /= np.abs(obj_train)
 
     # Find minimum one
     best_strategy = np.argmin(degradation)
-    #  if degradation[best_strategy] > stg.FILTER_SUBOPT:
-    #      stg.logger.warning("Sample assigned to strategy more " +
-    #                         "than %.2e suboptimal." % stg.FILTER_SUBOPT)
 
     return best_strategy, degradation[best_strategy]
 
@@ -58,9 +50,6 @@ class Filter(object):
         Assign samples to strategies choosing the ones minimizing the cost.
         """
 
-        # Backup strategies labels and encodings
-        #  self.y_full = self.y_train
-
         # Reassign y_labels
         # selected_strategies: find index where new labels are
         # discarded_strategies: -1
@@ -76,10 +65,13 @@ class Filter(object):
         stg.logger.info("Assign samples to selected strategies (n_jobs = %d)"
                         % n_jobs)
 
+        # Convert to records once: row access in pandas is slow
+        records = self.X_train.to_dict('records')
+
         results = Parallel(n_jobs=n_jobs, batch_size=batch_size)(
-            delayed(best_strategy)(self.X_train.iloc[i], self.obj_train[i],
+            delayed(best_strategy)(records[i], self.obj_train[i],
                                    self.encoding, self.problem)
-            for i in tqdm(range(len(discarded_samples)))
+            for i in tqdm(discarded_samples)
         )
 
         for i in range(len(discarded_samples)):
@@ -8,8 +8,6 @@ from cvxpy.reductions import Solution
 from cvxpy.constraints import Zero
 import numpy as np
 
-#  from pypardiso import spsolve
-#  from pypardiso.pardiso_wrapper import PyPardisoError
 from scipy.sparse.linalg import spsolve
 from scipy.sparse.linalg import factorized
 from scikits.umfpack import UmfpackWarning
@@ -160,9 +158,3 @@ class KKTSolver(QpSolver):
         results['time'] = t_end - t_start
 
         return results
-
-
-#  # Add solver to CVXPY solvers
-#  QP_SOLVERS.insert(0, KKT)
-#  SOLVER_MAP_QP[KKT] = KKTSolver()
-#  INSTALLED_SOLVERS.append(KKT)
@@ -210,7 +210,6 @@ class Optimizer(object):
                           "and sampling_fn")
 
         # Check if data is passed, otherwise train
-        #  if (X is not None) and not self.samples_present():
         if X is not None:
             stg.logger.info("Use new data")
             self.X_train = X
@@ -236,11 +235,6 @@ class Optimizer(object):
             self.obj_train = [r['cost'] for r in results]
             train_strategies = [r['strategy'] for r in results]
 
-            # Check if the problems are solvable
-            #  for r in results:
-            #      assert r['status'] in cps.SOLUTION_PRESENT, \
-            #          "The training points must be feasible"
-
             # Encode strategies
             self.y_train, self.encoding = \
                 encode_strategies(train_strategies)
@@ -354,25 +348,12 @@ class Optimizer(object):
             # Apply strategy
             strategy.apply(data, inverse_data[-1])
 
-            # Old
-            #  self._problem.populate(theta)
-            #
-            #  self._problem._relax_disc_var()
-            #
-            #  reduced_problem = \
-            #      self._problem._construct_reduced_problem(strategy)
-            #
-            #  data, full_chain, inv_data = \
-            #      reduced_problem.get_problem_data(solver=KKT)
-
             # Get KKT matrix
             KKT_mat = create_kkt_matrix(data)
             solve_kkt = factorize_kkt_matrix(KKT_mat)
 
             cache = {}
             cache['factors'] = solve_kkt
-            #  cache['inverse_data'] = inverse_data
-            #  cache['chain'] = solving_chain
 
             self._solver_cache += [cache]
 
@@ -502,10 +483,13 @@ class Optimizer(object):
             # Do not print anything if just one point
             ran = range(n_points)
 
+        # Convert to records once: row access in pandas is slow
+        records = X.to_dict('records')
+
         for i in ran:
 
             # Populate problem with i-th data point
-            self._problem.populate(X.iloc[i])
+            self._problem.populate(records[i])
             problem_data = self._problem._get_problem_data()
             results.append(self.choose_best(problem_data,
                                             classes[i, :],
@@ -687,21 +671,21 @@ class Optimizer(object):
             self._problem.solver_options.pop('MIPFocus')
             self._problem.solver_options.pop('TimeLimit')
 
-        time_test = [r['time'] for r in results_test]
-        cost_test = [r['cost'] for r in results_test]
+        time_test = np.array([r['time'] for r in results_test])
+        cost_test = np.array([r['cost'] for r in results_test])
 
-        time_heuristic = [r['time'] for r in results_heuristic]
-        cost_heuristic = [r['cost'] for r in results_heuristic]
+        time_heuristic = np.array([r['time'] for r in results_heuristic])
+        cost_heuristic = np.array([r['cost'] for r in results_heuristic])
 
         # Get predicted strategy for each point
         results_pred = self.solve(theta,
                                   message="Predict tight constraints for " +
                                   "test set",
                                   use_cache=use_cache)
-        time_pred = [r['time'] for r in results_pred]
-        solve_time_pred = [r['solve_time'] for r in results_pred]
-        pred_time_pred = [r['pred_time'] for r in results_pred]
-        cost_pred = [r['cost'] for r in results_pred]
+        time_pred = np.array([r['time'] for r in results_pred])
+        solve_time_pred = np.array([r['solve_time'] for r in results_pred])
+        pred_time_pred = np.array([r['pred_time'] for r in results_pred])
+        cost_pred = np.array([r['cost'] for r in results_pred])
         infeas = np.array([r['infeasibility'] for r in results_pred])
 
         n_test = len(theta)
@@ -714,15 +698,11 @@ class Optimizer(object):
             n_unpruned_strategies = n_strategies
 
         # Compute comparative statistics
-        time_comp = np.array([time_test[i] / time_pred[i]
-                              for i in range(n_test)])
+        time_comp = time_test / time_pred
 
-        time_comp_heuristic = np.array([time_heuristic[i] / time_pred[i]
-                                        for i in range(n_test)])
+        time_comp_heuristic = time_heuristic / time_pred
 
-        subopt = np.array([suboptimality(cost_pred[i], cost_test[i],
-                                         self._problem.sense())
-                           for i in range(n_test)])
+        subopt = suboptimality(cost_pred, cost_test, self._problem.sense())
 
         subopt_real = subopt[np.where(infeas <= stg.INFEAS_TOL)[0]]
         if any(subopt_real):
@@ -734,10 +714,8 @@ class Optimizer(object):
             avg_subopt = np.nan
             std_subopt = np.nan
 
-        subopt_heuristic = np.array([suboptimality(cost_heuristic[i],
-                                                   cost_test[i],
-                                                   self._problem.sense())
-                                     for i in range(n_test)])
+        subopt_heuristic = suboptimality(cost_heuristic, cost_test,
+                                         self._problem.sense())
 
         # accuracy
         test_accuracy, idx_correct = accuracy(results_pred, results_test,
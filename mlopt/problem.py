@@ -1,4 +1,5 @@
 from joblib import Parallel, delayed
+import pickle
 import numpy as np
 # Mlopt stuff
 from mlopt.strategy import Strategy
@@ -15,26 +16,24 @@ from cvxpy.reductions.solvers.solving_chain import SolvingChain
 from tqdm.auto import tqdm
 
 
-# DEBUG
-import pickle
-def is_pickleable(obj):
-    try:
-        pickle.dumps(obj)
-    except (pickle.PicklingError, TypeError):
-        return False
-    return True
-
-
-def populate_and_solve(problem, theta):
+def populate_and_solve(problem, theta, warm_start=True):
     """Single function to populate the problem with
        theta and solve it with the solver.
        Useful for multiprocessing."""
     problem.populate(theta)
-    results = problem.solve()
+    results = problem.solve(warm_start=warm_start)
 
     return results
 
 
+def populate_and_solve_batch(problem, theta, warm_start=True):
+    """Populate and solve the problem for each point in the list theta
+       sequentially. The problem is sent to each worker
+       only once per batch instead of once per point.
+       With warm start, each solve starts from the previous one."""
+    return [populate_and_solve(problem, t, warm_start) for t in theta]
+
+
 class Problem(object):
 
     def __init__(self,
@@ -84,9 +83,6 @@ class Problem(object):
         # Set options
         self.solver_options = solver_options
 
-        #  # Set solver cache
-        #  self._solver_cache = None
-
     def _canonicalize(self):
         """Canonicalize optimizaton problem.
         It constructs CVXPY solving chains.
@@ -219,32 +215,25 @@ class Problem(object):
 
         # Check [A | b]
         M_A = param_prog.A
-        n_row_A, n_col_A = M_A.shape
+        n_row_A = M_A.shape[0]
         n_con = param_prog.constr_size
 
-        # -1 to ignore the (theta, 1) offset column
-        for idx in range(n_col_A - 1):
-            col_start = M_A.indptr[idx]
-            col_end = M_A.indptr[idx+1]
-            indices = M_A.indices[col_start:col_end]
-            # Allow only elements in last row representing constraint vector
-            if any(indices < n_row_A - n_con):
-                return True
+        # Row indices of all the columns but the (theta, 1) offset one
+        # (the last). indptr[-2] is where the offset column starts.
+        indices = M_A.indices[:M_A.indptr[-2]]
+        # Allow only elements in last row representing constraint vector
+        if np.any(indices < n_row_A - n_con):
+            return True
 
         # Check P
         M_P = param_prog.P.tocsc()
-        n_row_P, n_col_P = M_P.shape
-        # -1 to ignore the (theta, 1) offset column
-        for idx in range(n_col_P - 1):
-            col_start = M_P.indptr[idx]
-            col_end = M_P.indptr[idx+1]
-            indices = M_P.indices[col_start:col_end]
-            if any(indices):  # Any element => parameters in P
-                return True
+        # Any element outside the offset column => parameters in P
+        if M_P.indptr[-2] > 0:
+            return True
 
         return False
 
-    def infeasibility(self, x, data):
+    def infeasibility(self, x, data, Fx=None):
         """Compute infeasibility for variables given internally stored solution.
         NB. Using conditions similar to:
         https://docs.mosek.com/9.0/pythonfusion/solving-conic.html#interior-point-termination-criterion
@@ -253,6 +242,7 @@ class Problem(object):
         Args:
             x (TODO): TODO
             data (TODO): TODO
+            Fx (numpy array): Precomputed F.dot(x). Default None.
 
         Returns: TODO
 
@@ -261,15 +251,19 @@ class Problem(object):
         A, b = data[cps.A], data[cps.B]
         F, g = data[cps.F], data[cps.G]
 
-        eq_viol, ineq_viol = 0, 0
-        if A.size:
-            eq_viol = np.linalg.norm(A.dot(x) - b, np.inf)
-            eq_viol /= 1 + np.linalg.norm(b, np.inf)
-        if F.size:
-            ineq_viol = np.linalg.norm(np.maximum(F.dot(x) - g, 0), np.inf)
-            ineq_viol /= 1 + np.linalg.norm(g, np.inf)
+        # NB. Check number of rows: size of sparse matrices is the
+        # number of nonzeros, which can be 0 with nonempty b or g
+        eq_viol, ineq_viol = 0., 0.
+        if A.shape[0]:
+            eq_viol = np.abs(A.dot(x) - b).max()
+            eq_viol /= 1 + np.abs(b).max()
+        if F.shape[0]:
+            if Fx is None:
+                Fx = F.dot(x)
+            ineq_viol = max((Fx - g).max(), 0.)
+            ineq_viol /= 1 + np.abs(g).max()
 
-        return np.maximum(eq_viol, ineq_viol)
+        return max(eq_viol, ineq_viol)
 
     def _get_problem_data(self):
         """TODO: Docstring for _get_problem_data.
@@ -288,13 +282,15 @@ class Problem(object):
         return data, inverse_data, solving_chain
 
     def solve(self, problem_data=None, solver_data=None,
-              strategy=None, cache=None):
+              strategy=None, cache=None, warm_start=True):
         """Solve optimization problem.
 
         Kwargs:
             solver (string): Solver to use. Defaults to
             strategy (Strategy): Strategy to apply. Default none.
             cache (dict): KKT solver cache
+            warm_start (bool): Warm start the solver from the previous
+                solve stored in the solver cache. Default True.
 
         Returns: Dictionary of results
 
@@ -321,7 +317,7 @@ class Problem(object):
             cache = self.cvxpy_problem._solver_cache
 
         raw_solution = solving_chain.solver.solve_via_data(
-            data, warm_start=True, verbose=self.verbose,
+            data, warm_start=warm_start, verbose=self.verbose,
             solver_opts=solver_options,
             solver_cache=cache
         )
@@ -363,8 +359,10 @@ class Problem(object):
             x = solver_solution.primal_vars[solver.VAR_ID]
             results['x'] = x
             results['cost'] = self.cvxpy_problem.objective.value
-            results['infeasibility'] = self.infeasibility(x, data)
-            results['strategy'] = Strategy(x, data)
+            # Share F x between infeasibility and tight constraints
+            Fx = data[cps.F].dot(x)
+            results['infeasibility'] = self.infeasibility(x, data, Fx)
+            results['strategy'] = Strategy(x, data, Fx)
         else:
             results['x'] = np.nan * np.ones(self.n_var)
             results['cost'] = np.inf
@@ -376,10 +374,13 @@ class Problem(object):
     def solve_parametric(self, theta,
                          batch_size=stg.JOBLIB_BATCH_SIZE,
                          parallel=True,  # Solve problems in parallel
+                         threads=False,  # Use threads instead of processes
+                         warm_start=True,  # Warm start consecutive solves
                          message="Solving for all theta",
                          ):
         """
         Solve parametric problems for each value of theta.
+        Duplicate values of theta are solved only once.
 
         Parameters
         ----------
@@ -387,6 +388,14 @@ class Problem(object):
             Parameter values.
         parallel : bool, optional
             Solve problems in parallel. Default True.
+        threads : bool, optional
+            Solve problems in parallel using threads instead of processes.
+            Each batch of points is solved on a copy of the problem.
+            Useful with solvers releasing the GIL. Default False.
+        warm_start : bool, optional
+            Warm start each solve from the previous point solved by the
+            same worker. Points are split in contiguous batches so
+            consecutive (close) points share a worker. Default True.
         message : str, optional
             Message to be printed on progress bar.
 
@@ -395,18 +404,55 @@ class Problem(object):
         dict
             Results dictionary.
         """
-        n = len(theta)  # Number of points
+        # Solve only for unique points keeping their order of appearance
+        _, idx_first, idx_inverse = np.unique(u.pandas2array(theta), axis=0,
+                                              return_index=True,
+                                              return_inverse=True)
+        idx_inverse = idx_inverse.ravel()
+        order = np.argsort(idx_first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        theta = theta.iloc[idx_first[order]]
+
+        # Convert to records once: row access in pandas is slow
+        records = theta.to_dict('records')
+
+        n = len(theta)  # Number of unique points
+        if n < len(idx_inverse):
+            stg.logger.info("Skipping %d duplicate points" %
+                            (len(idx_inverse) - n))
 
         n_jobs = u.get_n_processes() if parallel else 1
-        stg.logger.info(message + " (n_jobs = %d)" % n_jobs)
+        prefer = "threads" if threads else "processes"
+        stg.logger.info(message + " (n_jobs = %d, %s)" % (n_jobs, prefer))
+
+        # Split points in contiguous batches to solve within each worker
+        n_batches = max(min(n, n_jobs * stg.PARAMETRIC_BATCHES_PER_JOB), 1)
+        batches = np.array_split(np.arange(n), n_batches)
 
         # Remove unpickleable objects
         self.make_serializable()
 
-        results = Parallel(n_jobs=n_jobs, batch_size=batch_size)(
-            delayed(populate_and_solve)(self, theta.iloc[i])
-            for i in tqdm(range(n))
-        )
+        # Threads share memory: solve each batch on its own copy
+        # since populate and solve modify the problem.
+        # NB. Copy with pickle as the processes do: deepcopy gives new
+        # ids to variables and parameters, not matching the cached chain
+        def dispatch_batches(pbar):
+            for idx in batches:
+                # Progress bar counts points, as batches are dispatched
+                pbar.update(len(idx))
+                yield delayed(populate_and_solve_batch)(
+                    pickle.loads(pickle.dumps(self)) if threads else self,
+                    [records[i] for i in idx],
+                    warm_start)
+
+        with tqdm(total=n, unit="points") as pbar:
+            results = Parallel(n_jobs=n_jobs, batch_size=batch_size,
+                               prefer=prefer)(dispatch_batches(pbar))
+        results = [r for batch in results for r in batch]
+
+        # Map results back to all points (copy dict for duplicates)
+        results = [dict(results[rank[j]]) for j in idx_inverse]
 
         # Remove unpickleable objects for storage
         self.make_serializable()
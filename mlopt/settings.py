@@ -22,6 +22,7 @@ logger.propagate = False   # Disable double logging
 # Parallel
 JOBLIB_BATCH_SIZE = 'auto'
 #  JOBLIB_BATCH_SIZE = 2
+PARAMETRIC_BATCHES_PER_JOB = 4  # Batches of points per worker
 
 
 # Define constants
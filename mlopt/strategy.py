@@ -1,12 +1,9 @@
-from joblib import Parallel, delayed
 import numpy as np
 import mlopt.settings as stg
 import mlopt.error as e
-import mlopt.utils as u
 import cvxpy.settings as cps
 import scipy.sparse as spa
 from time import time
-from tqdm import tqdm
 
 
 class Strategy(object):
@@ -22,22 +19,44 @@ class Strategy(object):
         Value of the integer variables. The values are numpy int arrays.
     """
 
-    def __init__(self, x, data):
-        """Initialize strategy from problem data."""
+    # One strategy is stored per sample: avoid per-instance __dict__
+    __slots__ = ('tight_constraints', 'int_vars', '_key')
 
-        self.tight_constraints = self.get_tight_constraints(x, data)
-        self.int_vars = x[data[cps.INT_IDX]]
-
-        # Store hash for comparisons
-        self._hash = hash((frozenset(self.tight_constraints),
-                           frozenset(self.int_vars)))
+    def __init__(self, x, data, Fx=None):
+        """Initialize strategy from problem data.
+        Fx is the optional precomputed F.dot(x)."""
 
-    def get_tight_constraints(self, x, data):
+        self.tight_constraints = self.get_tight_constraints(x, data, Fx)
+        self.int_vars = x[data[cps.INT_IDX]]
+        self._set_key()
+
+    def _set_key(self):
+        """Store packed key for comparisons."""
+        # Adding 0. maps -0. to 0. so that equal values have equal bytes
+        self._key = (len(self.tight_constraints),
+                     np.packbits(self.tight_constraints).tobytes(),
+                     (self.int_vars + 0.).tobytes())
+
+    def __getstate__(self):
+        """Pickle only the strategy values (the key is rebuilt on load)."""
+        return {'tight_constraints': self.tight_constraints,
+                'int_vars': self.int_vars}
+
+    def __setstate__(self, state):
+        """Restore strategy from pickled state. Also accepts the
+        __dict__ state of strategies pickled by older versions."""
+        self.tight_constraints = np.asarray(state['tight_constraints'],
+                                            dtype=bool)
+        self.int_vars = np.asarray(state['int_vars'])
+        self._set_key()
+
+    def get_tight_constraints(self, x, data, Fx=None):
         """Compute tight constraints for solution x
 
         Args:
             data (TODO): TODO
             x (TODO): TODO
+            Fx (numpy array): Precomputed F.dot(x). Default None.
 
         Returns: TODO
 
@@ -45,30 +64,26 @@ class Strategy(object):
         # Check only inequalities
         F, g = data[cps.F], data[cps.G]
 
-        tight_constraints = np.array([], dtype=np.bool)
+        if not F.shape[0]:
+            return np.zeros(0, dtype=bool)
 
-        # Constraint is tight if ||F * x - g|| <= eps (1 + rel_tol)
-        if F.size > 0:
-            tight_constraints = np.abs(F.dot(x) - g) <= \
-                stg.TIGHT_CONSTRAINTS_TOL * (1 + np.linalg.norm(g, np.inf))
+        if Fx is None:
+            Fx = F.dot(x)
 
-        return tight_constraints
+        # Constraint is tight if ||F * x - g|| <= eps (1 + rel_tol)
+        tol = stg.TIGHT_CONSTRAINTS_TOL * (1 + np.abs(g).max())
+        return np.abs(Fx - g) <= tol
 
     def __hash__(self):
-        """Overrides default hash implementation"""
-        return self._hash
+        """Overrides default hash implementation.
+        NB. Do not store it: hashes of bytes are salted differently in
+        each process and strategies are created in worker processes."""
+        return hash(self._key)
 
     def __eq__(self, other):
         """Overrides the default equality implementation"""
         if isinstance(other, Strategy):
-
-            if np.any(self.tight_constraints != other.tight_constraints):
-                return False
-
-            if np.any(self.int_vars != other.int_vars):
-                return False
-
-            return True
+            return self._key == other._key
         else:
             return False
 
@@ -115,7 +130,11 @@ class Strategy(object):
         b_active = data[cps.G][self.tight_constraints]
 
         # 2. Fix integer variables: F_fix x = g_fix
-        A_fix = spa.eye(n_var, format='csc')[data[cps.INT_IDX]]
+        # (build selection rows directly instead of slicing the identity)
+        int_idx = data[cps.INT_IDX]
+        n_int = len(int_idx)
+        A_fix = spa.csc_matrix((np.ones(n_int), (np.arange(n_int), int_idx)),
+                               shape=(n_int, n_var))
         b_fix = self.int_vars
 
         # Combine in A_ref and b_red
@@ -144,36 +163,24 @@ def unique_strategies(strategies):
         Unique strategies.
     """
 
-    # Using set (we must define hash to use this)
-    unique = list(set(strategies))
-
-    # Using list
-    #  unique = []
-    #  # traverse for all elements
-    #  for x in strategies:
-    #      # check if x exists in unique_list or not
-    #      if x not in unique:
-    #          unique.append(x)
+    # Using dict keys (we must define hash to use this).
+    # Unlike a set, it keeps the order of first appearance.
+    unique = list(dict.fromkeys(strategies))
 
     return unique
 
 
 def assign_to_unique_strategy(strategy, unique_strategies):
+    """Find index of strategy in unique_strategies.
+    NB. Deprecated: encode_strategies uses a dict lookup instead."""
     y = next((index for (index, s) in enumerate(unique_strategies)
              if strategy == s), -1)
-    #  y = -1
-    #  n_unique_strategies = len(unique_strategies)
-    #  for j in range(n_unique_strategies):
-    #      if unique_strategies[j] == strategy:
-    #          y = j
-    #          break
     if y == -1:
         e.value_error("Strategy not found")
     return y
 
 
-def encode_strategies(strategies, batch_size=stg.JOBLIB_BATCH_SIZE,
-                      parallel=True):
+def encode_strategies(strategies, batch_size=None, parallel=None):
     """
     Encode strategies
 
@@ -182,6 +189,11 @@ def encode_strategies(strategies, batch_size=stg.JOBLIB_BATCH_SIZE,
     ----------
     strategies : Strategies array
         Array of strategies to be encoded.
+    batch_size : optional
+        Deprecated and ignored.
+    parallel : bool, optional
+        Deprecated and ignored. Strategies are assigned to labels
+        with a dict lookup, which does not need to run in parallel.
 
     Returns
     -------
@@ -192,6 +204,10 @@ def encode_strategies(strategies, batch_size=stg.JOBLIB_BATCH_SIZE,
     """
     stg.logger.info("Encoding strategies")
 
+    if batch_size is not None or parallel is not None:
+        e.warning("encode_strategies arguments batch_size and parallel "
+                  "are deprecated and ignored.")
+
     stg.logger.info("Getting unique set of strategies")
     start_time = time()
     unique = unique_strategies(strategies)
@@ -200,16 +216,10 @@ def encode_strategies(strategies, batch_size=stg.JOBLIB_BATCH_SIZE,
     n_unique_strategies = len(unique)
     stg.logger.info("Found %d unique strategies" % n_unique_strategies)
 
-    n_jobs = u.get_n_processes() if parallel else 1
-
     # Map strategies to number
-    stg.logger.info("Assign samples to unique strategies (n_jobs = %d)"
-                    % n_jobs)
-
-    results = Parallel(n_jobs=n_jobs, batch_size=batch_size)(
-        delayed(assign_to_unique_strategy)(s, unique)
-        for s in tqdm(strategies))
-    y = np.array(results)
+    stg.logger.info("Assign samples to unique strategies")
+    labels = {s: i for i, s in enumerate(unique)}
+    y = np.array([labels[s] for s in strategies])
 
     return y, unique
 
@@ -5,6 +5,40 @@ from mlopt.sampling import uniform_sphere_sample
 import pandas as pd
 import cvxpy as cp
 from mlopt.settings import logger
+from mlopt.filter import Filter
+
+
+class CostProblem(object):
+    """Problem returning cost p for strategy 'a' and 10 p for 'b'"""
+
+    def populate(self, theta):
+        self.p = theta['p']
+
+    def solve(self, strategy=None):
+        scale = 1. if strategy == 'a' else 10.
+        return {'cost': scale * self.p, 'infeasibility': 0.}
+
+
+class TestAssignSamples(unittest.TestCase):
+
+    def test_discarded_samples(self):
+        """Discarded samples are evaluated with their own
+           parameters and objective"""
+        X_train = pd.DataFrame({'p': [1., 2., 3., 4.]})
+        obj_train = [10., 2., 3., 40.]
+        f = Filter(X_train=X_train,
+                   y_train=np.array([0, 1, 2, 3]),
+                   obj_train=obj_train,
+                   encoding=['a', 'b'],
+                   problem=CostProblem())
+
+        # Discard samples with strategies 2 and 3
+        degradation = f.assign_samples(np.array([2, 3]), np.array([0, 1]),
+                                       batch_size=1, parallel=False)
+
+        # Sample 2 (p = 3, cost 3) -> 'a', sample 3 (p = 4, cost 40) -> 'b'
+        np.testing.assert_array_equal(f.y_train, np.array([0, 1, 0, 1]))
+        np.testing.assert_array_almost_equal(degradation, np.zeros(2))
 
 
 class TestFilter(unittest.TestCase):
@@ -2,7 +2,10 @@ import unittest
 import numpy as np
 import cvxpy as cp
 import pandas as pd
+import scipy.sparse as spa
+from types import SimpleNamespace
 from mlopt.optimizer import Optimizer
+from mlopt.problem import Problem
 from mlopt.settings import PYTORCH
 from mlopt.sampling import uniform_sphere_sample
 
@@ -116,3 +119,31 @@ class TestMatrixParams(unittest.TestCase):
         # Assert fewer strategies than training samples
         self.assertTrue(len(m.encoding) < len(df_train))
         self.assertTrue(len(m.encoding) > 1)
+
+    def test_parameter_in_quadratic_cost(self):
+        """Parameter only in the quadratic cost is in matrices"""
+        x = cp.Variable()
+        p = cp.Parameter(nonneg=True, name='p')
+        cost = p * cp.square(x) + x
+        problem = Problem(cp.Problem(cp.Minimize(cost), [x >= -10]))
+
+        self.assertTrue(problem.parameters_in_matrices)
+
+    def test_parameter_in_first_entry_of_P(self):
+        """Parameter mapping only to the first entry of vec(P)"""
+        # One parameter column and the (theta, 1) offset column.
+        # [A | b] has 2 rows with the parameter only in b (last row).
+        M_A = spa.csc_matrix(np.array([[0., 1.],
+                                       [1., 2.]]))
+        M_P = spa.csc_matrix(np.array([[1., 0.],
+                                       [0., 0.]]))
+        param_prog = SimpleNamespace(A=M_A, P=M_P, constr_size=1)
+        cache = SimpleNamespace(param_prog=param_prog)
+        problem = SimpleNamespace(_cache=cache)
+
+        self.assertTrue(Problem.check_parameters_in_matrices(problem))
+
+        # Parameter only in b and not in P
+        param_prog.P = spa.csc_matrix(np.array([[0., 1.],
+                                                [0., 0.]]))
+        self.assertFalse(Problem.check_parameters_in_matrices(problem))
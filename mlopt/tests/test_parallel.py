@@ -6,6 +6,7 @@ from mlopt.settings import PYTORCH
 from mlopt.problem import Problem
 from mlopt.tests.settings import TEST_TOL as TOL
 from mlopt.sampling import uniform_sphere_sample
+from mlopt.strategy import encode_strategies
 import pandas as pd
 import cvxpy as cp
 
@@ -125,6 +126,71 @@ class TestParallel(unittest.TestCase):
         # in multiprocessing
         m.performance(df_test, parallel=True)
 
+    def test_parallel_threads_vs_serial(self):
+        """Test parallel threads VS serial parametric solve"""
+
+        # Generate data
+        np.random.seed(1)
+        T = 5
+        M = 2.
+        x_init = 2.
+        radius = 2.
+        n_train = 100   # Number of samples
+
+        # Define problem
+        x = cp.Variable(T+1)
+        u = cp.Variable(T)
+
+        # Define parameter and sampling points
+        d = cp.Parameter(T, nonneg=True, name="d")
+        d_bar = 3. * np.ones(T)
+        X_d = uniform_sphere_sample(d_bar, radius, n=n_train)
+        df = pd.DataFrame({'d': list(X_d)})
+
+        # Constaints
+        constraints = [x[0] == x_init]
+        for t in range(T):
+            constraints += [x[t+1] == x[t] + u[t] - d[t]]
+        constraints += [u >= 0, u <= M]
+
+        # Objective
+        cost = cp.sum(cp.maximum(x, -x)) + cp.sum(u)
+
+        # Define problem
+        cvxpy_problem = cp.Problem(cp.Minimize(cost), constraints)
+        problem = Problem(cvxpy_problem)
+
+        results_serial = problem.solve_parametric(df, parallel=False)
+        results_threads = problem.solve_parametric(df, parallel=True,
+                                                   threads=True)
+
+        for i in range(n_train):
+            npt.assert_array_almost_equal(results_serial[i]['x'],
+                                          results_threads[i]['x'],
+                                          decimal=TOL)
+            self.assertTrue(results_serial[i]['strategy'] ==
+                            results_threads[i]['strategy'])
+
+    def test_parallel_encode_strategies(self):
+        """Test encoding strategies computed in different processes"""
+
+        # Define problem: x = b is optimal for every b > 0
+        np.random.seed(1)
+        n = 2
+        n_train = 100
+        x = cp.Variable(n)
+        b = cp.Parameter(n, name='b')
+        constraints = [x >= b, x >= 0]
+        problem = Problem(cp.Problem(cp.Minimize(cp.sum(x)), constraints))
+        df = pd.DataFrame({'b': list(1. + np.random.rand(n_train, n))})
+
+        results = problem.solve_parametric(df, parallel=True)
+        y, unique = encode_strategies([r['strategy'] for r in results])
+
+        # All points share the same strategy
+        self.assertEqual(len(unique), 1)
+        npt.assert_array_equal(y, np.zeros(n_train, dtype=int))
+
     # DOES NOT WORK YET BECAUSE IT CANNOT PICKLE pardiso objects
     #  def test_parallel_strategy_selection(self):
     #      """Choose best strategy in parallel"""
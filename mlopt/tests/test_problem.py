@@ -2,6 +2,9 @@ import unittest
 import numpy as np
 import numpy.testing as npt
 import cvxpy as cp
+import cvxpy.settings as cps
+import scipy.sparse as spa
+import pandas as pd
 from mlopt.problem import Problem
 from mlopt.settings import DEFAULT_SOLVER
 from mlopt.tests.settings import TEST_TOL as TOL
@@ -38,6 +41,13 @@ class TestProblem(unittest.TestCase):
 
         self.assertTrue(abs(viol_cvxpy - viol_manual) <= TOL)
 
+        # All-zero sparse F (no nonzeros) with g < 0 is violated
+        data_zero = dict(data)
+        data_zero[cps.F] = spa.csc_matrix((m, n))
+        data_zero[cps.G] = -np.ones(m)
+        viol_zero = mlprob.infeasibility(x_val, data_zero)
+        self.assertTrue(abs(viol_zero - 0.5) <= TOL)
+
     def test_solve_cvxpy(self):
         """Solve cvxpy problem vs optimizer problem.
            Expect similar solutions."""
@@ -79,3 +89,30 @@ class TestProblem(unittest.TestCase):
         npt.assert_array_less(results_second['time'],
                               results_first['time'])
 
+    def test_solve_parametric_duplicates(self):
+        """Solve parametric problem with duplicate points.
+           Expect the same results as the unique points."""
+        np.random.seed(1)
+        n = 5
+        m = 15
+        x = cp.Variable(n)
+        b = cp.Parameter(m, name='b')
+        c = np.random.rand(n)
+        A = np.random.randn(m, n)
+        constraints = [A @ x <= b, x >= -10, x <= 10]
+        problem = Problem(cp.Problem(cp.Minimize(c @ x), constraints))
+
+        b_vals = [np.random.rand(m) for _ in range(3)]
+        df = pd.DataFrame({'b': [b_vals[i] for i in [0, 1, 0, 2, 1]]})
+        df_unique = pd.DataFrame({'b': b_vals})
+
+        results = problem.solve_parametric(df, parallel=False)
+        results_unique = problem.solve_parametric(df_unique, parallel=False)
+
+        self.assertEqual(len(results), len(df))
+        for i, j in enumerate([0, 1, 0, 2, 1]):
+            npt.assert_almost_equal(results[i]['x'], results_unique[j]['x'],
+                                    decimal=TOL)
+            self.assertTrue(results[i]['strategy'] ==
+                            results_unique[j]['strategy'])
+        self.assertIsNot(results[0], results[2])
@@ -9,6 +9,40 @@ import tempfile
 import os
 import pandas as pd
 import cvxpy as cp
+import pickle
+from mlopt.problem import Problem
+from mlopt.strategy import Strategy
+
+
+class TestSaveStrategy(unittest.TestCase):
+
+    def setUp(self):
+        x = cp.Variable(2)
+        y = cp.Variable(integer=True)
+        constraints = [x >= 1, x <= 3, y >= -0.5, y <= 2]
+        cvxpy_problem = cp.Problem(cp.Minimize(cp.sum(x) + y), constraints)
+        self.strategy = Problem(cvxpy_problem).solve()['strategy']
+
+    def test_pickle_strategy(self):
+        """Pickle and unpickle strategy"""
+        loaded = pickle.loads(pickle.dumps(self.strategy))
+
+        self.assertTrue(loaded == self.strategy)
+        self.assertEqual(hash(loaded), hash(self.strategy))
+        npt.assert_array_equal(loaded.tight_constraints,
+                               self.strategy.tight_constraints)
+        npt.assert_array_equal(loaded.int_vars, self.strategy.int_vars)
+
+    def test_load_old_strategy(self):
+        """Load strategy pickled with __dict__ state by older versions"""
+        old_state = {'tight_constraints': self.strategy.tight_constraints,
+                     'int_vars': self.strategy.int_vars,
+                     '_hash': 0}
+        loaded = Strategy.__new__(Strategy)
+        loaded.__setstate__(old_state)
+
+        self.assertTrue(loaded == self.strategy)
+        self.assertEqual(hash(loaded), hash(self.strategy))
 
 
 class TestSave(unittest.TestCase):
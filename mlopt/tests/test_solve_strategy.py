@@ -5,7 +5,9 @@ import scipy.sparse as spa
 import numpy.testing as npt
 from mlopt.tests.settings import TEST_TOL as TOL
 from mlopt.problem import Problem
+from mlopt.strategy import Strategy, encode_strategies
 import cvxpy as cp
+import cvxpy.settings as cps
 
 
 class TestSolveStrategy(unittest.TestCase):
@@ -277,6 +279,43 @@ class TestSolveStrategy(unittest.TestCase):
             results["cost"], results_new["cost"], decimal=TOL
         )
 
+    def test_encode_strategies(self):
+        """Test encoding of repeated strategies"""
+
+        # Define problem
+        x = cp.Variable(2)
+        b = cp.Parameter(2, name='b')
+        cost = cp.sum(x)
+        constraints = [x >= b, x >= 0]
+        problem = Problem(cp.Problem(cp.Minimize(cost), constraints))
+
+        # First two points have the same tight constraints
+        strategies = []
+        for b_val in [np.array([1., 1.]), np.array([2., 3.]),
+                      np.array([-1., 1.])]:
+            problem.populate({'b': b_val})
+            strategies.append(problem.solve()['strategy'])
+
+        self.assertTrue(strategies[0] == strategies[1])
+        self.assertEqual(hash(strategies[0]), hash(strategies[1]))
+        self.assertFalse(strategies[0] == strategies[2])
+
+        # Labels follow order of first appearance
+        y, unique = encode_strategies(strategies + [strategies[0]])
+        self.assertEqual(len(unique), 2)
+        npt.assert_array_equal(y, np.array([0, 0, 1, 0]))
+
+    def test_tight_constraints_zero_F(self):
+        """Test tight constraints mask length with all-zero F"""
+        n, m = 3, 4
+        data = {cps.F: spa.csc_matrix((m, n)),
+                cps.G: np.array([0., 1., 0., -1.])}
+        strategy = Strategy.__new__(Strategy)
+        tight = strategy.get_tight_constraints(np.ones(n), data)
+
+        self.assertEqual(len(tight), m)
+        npt.assert_array_equal(tight, np.array([True, False, True, False]))
+
 
 if __name__ == "__main__":
     unittest.main()
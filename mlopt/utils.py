@@ -96,26 +96,20 @@ def pandas2array(X):
     else:
         if isinstance(X, pd.Series):
             X = pd.DataFrame(X).transpose()
-        # get number of datapoints
-        n_data = len(X)
-
-        x_temp_list = []
-        for i in range(n_data):
-            x_temp_list.append(
-                np.concatenate([np.atleast_1d(v).flatten()
-                                for v in X.iloc[i].values])
-                )
-        X_new = np.vstack(x_temp_list)
+        # Unroll each column and stack them side by side
+        X_new = np.hstack([np.vstack([np.atleast_1d(v).flatten()
+                                      for v in X[c].values])
+                           for c in X.columns])
 
     return X_new
 
 
 def suboptimality(cost_pred, cost_test, sense):
-    """Compute suboptimality"""
-    if np.abs(cost_test) < stg.DIVISION_TOL:
-        cost_norm = 1.
-    else:
-        cost_norm = np.abs(cost_test)
+    """Compute suboptimality (elementwise for arrays of costs)"""
+    cost_pred = np.asarray(cost_pred)
+    cost_test = np.asarray(cost_test)
+    cost_norm = np.abs(cost_test)
+    cost_norm = np.where(cost_norm < stg.DIVISION_TOL, 1., cost_norm)
 
     if sense == cp.Minimize:
         return (cost_pred - cost_test)/cost_norm